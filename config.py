@@ -1,5 +1,7 @@
 # SportsAlgo NHL Daily Picks — Configuration
 
+from pathlib import Path
+
 # ── NHL API Base URLs ──
 NHL_API_BASE = "https://api-web.nhle.com"
 NHL_STATS_BASE = "https://api.nhle.com/stats/rest/en/team"
@@ -50,3 +52,6 @@ EARLY_SEASON_GP = 10  # teams with fewer GP get star cap = 2
 SHEET_NAME = "SportsAlgo NHL Picks"
 TAB_DAILY = "Daily Picks"
 TAB_TRACKER = "Season Tracker"
+
+# ── Local Cache ──
+CACHE_DIR = Path.home() / ".cache" / "sportsalgo"
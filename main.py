@@ -2,8 +2,10 @@
 
 Run daily via GitHub Actions or manually:
     python main.py
+    python main.py --no-cache   # bypass the on-disk caches (NHL API, Daily Picks)
 """
 
+import argparse
 import logging
 import sys
 from datetime import date, datetime, timedelta
@@ -11,10 +13,17 @@ from zoneinfo import ZoneInfo
 
 _ET = ZoneInfo("America/New_York")
 
-from nhl_api import fetch_standings, fetch_team_stats, fetch_todays_games, fetch_scores, build_full_name_to_abbrev
+from nhl_api import (
+    fetch_standings,
+    fetch_team_stats,
+    fetch_todays_games,
+    fetch_scores,
+    build_full_name_to_abbrev,
+    set_cache_enabled,
+)
 from odds_api import fetch_nhl_odds
 from model import predict_today
-from sheets import get_client, write_daily_picks, write_standings, append_to_tracker, update_results
+from sheets import get_client, publish_picks, write_standings, update_results
 
 logging.basicConfig(
     level=logging.INFO,
@@ -23,7 +32,17 @@ logging.basicConfig(
 log = logging.getLogger("sportsalgo")
 
 
-def main() -> None:
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="SportsAlgo NHL daily picks")
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="ignore and don't write the on-disk caches (forces a Daily Picks rewrite)",
+    )
+    args = parser.parse_args(argv)
+    if args.no_cache:
+        set_cache_enabled(False)
+
     today = datetime.now(_ET).date()
     yesterday = today - timedelta(days=1)
     log.info("SportsAlgo NHL — run date: %s", today)
@@ -45,8 +64,11 @@ def main() -> None:
         log.error("Could not fetch standings — aborting")
         sys.exit(1)
 
+    # One name→abbrev map serves both the stats API and The Odds API
+    name_map = build_full_name_to_abbrev(standings)
+
     log.info("Fetching team stats…")
-    team_stats = fetch_team_stats(standings)
+    team_stats = fetch_team_stats(name_map=name_map)
     if not team_stats:
         log.warning("Team stats unavailable — using standings-only mode")
 
@@ -61,7 +83,6 @@ def main() -> None:
 
     # ── Step 3 & 4: Compute ratings and predict ──
     log.info("Fetching odds…")
-    name_map = build_full_name_to_abbrev(standings)
     odds_map = fetch_nhl_odds(name_map)
 
     log.info("Running predictions for %d games…", len(games))
@@ -69,8 +90,8 @@ def main() -> None:
 
     # ── Step 5: Write to Google Sheet ──
     if client:
-        write_daily_picks(client, predictions, today.isoformat(), yesterday.isoformat())
-        append_to_tracker(client, predictions, today.isoformat())
+        # Daily Picks and the tracker append run concurrently (independent tabs)
+        publish_picks(client, predictions, today.isoformat(), yesterday.isoformat())
     else:
         log.info("Sheets client unavailable — skipping sheet writes")
 
@@ -1,8 +1,11 @@
 """Prediction engine — 7-factor weighted model with situational adjustments."""
 
+import asyncio
 import logging
 import math
-from datetime import date, timedelta
+from datetime import date
+
+import numpy as np
 
 from config import (
     WEIGHTS,
@@ -14,7 +17,8 @@ from config import (
     SKIP_THRESHOLD,
     EARLY_SEASON_GP,
 )
-from nhl_api import fetch_team_schedule, game_dates_from_schedule
+from model_kernels import normalize_and_score
+from nhl_api import fetch_team_schedule, fetch_team_schedules_bulk, game_dates_from_schedule
 
 log = logging.getLogger(__name__)
 
@@ -48,14 +52,6 @@ def _ev_pct(model_prob: float, odds: int) -> float:
 
 # ── Helpers ──────────────────────────────────────────────────────────────
 
-def normalize(value: float, all_values: list[float]) -> float:
-    """Min-max normalize *value* into [0, 1] given *all_values*."""
-    lo, hi = min(all_values), max(all_values)
-    if hi == lo:
-        return 0.5
-    return (value - lo) / (hi - lo)
-
-
 def _safe(val, default=0.0):
     """Return float(val) or *default* if val is None / non-numeric."""
     try:
@@ -66,32 +62,43 @@ def _safe(val, default=0.0):
 
 # ── Factor Extraction ────────────────────────────────────────────────────
 
+# Numeric standings fields (always JSON numbers or missing/null, so no _safe)
+_FLOAT_FIELDS = (
+    "gamesPlayed", "goalFor", "goalAgainst", "pointPctg",
+    "l10Wins", "l10Losses", "l10OtLosses",
+    "homeWins", "homeLosses", "homeOtLosses",
+    "roadWins", "roadLosses", "roadOtLosses",
+    "streakCount",
+)
+
 def _extract_factors(team: dict, stats: dict | None) -> dict:
     """Compute the raw (unnormalized) factor values for one team.
 
     *team* is a standings entry; *stats* is the optional stats-API row.
     """
-    gp = max(_safe(team.get("gamesPlayed"), 1), 1)
-    gf = _safe(team.get("goalFor"))
-    ga = _safe(team.get("goalAgainst"))
+    v = {k: float(team.get(k) or 0.0) for k in _FLOAT_FIELDS}
+
+    gp = max(v["gamesPlayed"], 1)
+    gf = v["goalFor"]
+    ga = v["goalAgainst"]
     goal_diff_per_gp = (gf - ga) / gp
 
-    point_pct = _safe(team.get("pointPctg"))
+    point_pct = v["pointPctg"]
 
     # L10 point %
-    l10w = _safe(team.get("l10Wins"))
-    l10l = _safe(team.get("l10Losses"))
-    l10o = _safe(team.get("l10OtLosses"))
+    l10w = v["l10Wins"]
+    l10l = v["l10Losses"]
+    l10o = v["l10OtLosses"]
     l10_gp = l10w + l10l + l10o
     recent_form = (l10w * 2 + l10o) / (l10_gp * 2) if l10_gp else 0.5
 
     # Home / road win%
-    hw = _safe(team.get("homeWins"))
-    hl = _safe(team.get("homeLosses"))
-    ho = _safe(team.get("homeOtLosses"))
-    rw = _safe(team.get("roadWins"))
-    rl = _safe(team.get("roadLosses"))
-    ro = _safe(team.get("roadOtLosses"))
+    hw = v["homeWins"]
+    hl = v["homeLosses"]
+    ho = v["homeOtLosses"]
+    rw = v["roadWins"]
+    rl = v["roadLosses"]
+    ro = v["roadOtLosses"]
     home_gp = hw + hl + ho
     road_gp = rw + rl + ro
     home_pct = (hw * 2 + ho) / (home_gp * 2) if home_gp else 0.5
@@ -111,7 +118,7 @@ def _extract_factors(team: dict, stats: dict | None) -> dict:
 
     # Streak momentum: encode W streaks positive, L negative, OT as half
     streak_code = team.get("streakCode", "")
-    streak_count = _safe(team.get("streakCount"))
+    streak_count = v["streakCount"]
     if streak_code == "W":
         streak = streak_count
     elif streak_code == "L":
@@ -134,6 +141,15 @@ def _extract_factors(team: dict, stats: dict | None) -> dict:
 
 # ── Team Ratings ─────────────────────────────────────────────────────────
 
+# Factors weighted into the composite, in matrix column order — derived
+# from WEIGHTS so adding a factor only touches config and _extract_factors
+_FACTOR_KEYS = tuple(k for k in WEIGHTS if k != "home_road_split")
+# home/road are normalized alongside but weighted per venue in predict_slate,
+# so they get zero weight in the composite
+_NORM_KEYS = _FACTOR_KEYS + ("home_pct", "road_pct")
+_COMPOSITE_WEIGHTS = np.array([WEIGHTS.get(k, 0.0) for k in _NORM_KEYS], dtype=np.float64)
+
+
 def compute_team_ratings(
     standings: list[dict],
     team_stats: dict[str, dict],
@@ -150,185 +166,182 @@ def compute_team_ratings(
     if not raw:
         return {}
 
-    # Collect all values per factor for normalization
-    factor_keys = [
-        "goal_diff_per_gp", "point_pct", "recent_form",
-        "special_teams", "shot_diff_per_gp", "streak_momentum",
-        # home/road handled separately
-    ]
-    all_vals: dict[str, list[float]] = {k: [] for k in factor_keys}
-    all_vals["home_pct"] = []
-    all_vals["road_pct"] = []
-    for r in raw.values():
-        for k in factor_keys:
-            all_vals[k].append(r[k])
-        all_vals["home_pct"].append(r["home_pct"])
-        all_vals["road_pct"].append(r["road_pct"])
-
-    # Normalize and compute composite
+    # (teams × factors) matrix, min-max normalized per column
+    X = np.array([[r[k] for k in _NORM_KEYS] for r in raw.values()], dtype=np.float64)
+    Xn, composite = normalize_and_score(X, _COMPOSITE_WEIGHTS)
+
     ratings: dict[str, dict] = {}
-    for abbrev, r in raw.items():
-        normed = {}
-        for k in factor_keys:
-            normed[k] = normalize(r[k], all_vals[k])
-
-        normed["home_pct"] = normalize(r["home_pct"], all_vals["home_pct"])
-        normed["road_pct"] = normalize(r["road_pct"], all_vals["road_pct"])
-
-        composite = (
-            WEIGHTS["goal_diff_per_gp"] * normed["goal_diff_per_gp"]
-            + WEIGHTS["point_pct"] * normed["point_pct"]
-            + WEIGHTS["recent_form"] * normed["recent_form"]
-            + WEIGHTS["special_teams"] * normed["special_teams"]
-            + WEIGHTS["shot_diff_per_gp"] * normed["shot_diff_per_gp"]
-            + WEIGHTS["streak_momentum"] * normed["streak_momentum"]
-            # home_road_split weight is applied contextually in predict_game
-        )
-        ratings[abbrev] = {**normed, "composite": composite, "gp": r["gp"]}
+    for (abbrev, r), normed, comp in zip(raw.items(), Xn.tolist(), composite.tolist()):
+        ratings[abbrev] = {**dict(zip(_NORM_KEYS, normed)), "composite": comp, "gp": r["gp"]}
 
     return ratings
 
 
 # ── Rest / Schedule Situations ───────────────────────────────────────────
 
-def detect_rest_situation(
-    team_abbrev: str,
-    game_date: date,
-    schedule_cache: dict[str, list[date]],
-) -> dict:
-    """Detect B2B, 3-in-4, or extended rest for *team_abbrev* on *game_date*.
-
-    Returns {"back_to_back": bool, "three_in_four": bool, "rest_days": int}.
-    """
-    result = {"back_to_back": False, "three_in_four": False, "rest_days": 1}
+_NO_REST = {"back_to_back": False, "three_in_four": False, "rest_days": 1}
 
-    if team_abbrev not in schedule_cache:
-        sched = fetch_team_schedule(team_abbrev)
-        schedule_cache[team_abbrev] = game_dates_from_schedule(sched)
 
-    dates = schedule_cache[team_abbrev]
-    if not dates:
-        log.warning("No schedule data for %s — skipping rest adjustments", team_abbrev)
-        return result
+def _rest_from_dates(dates: np.ndarray, game_date: date) -> dict:
+    """Rest profile on *game_date* given a team's sorted game-date ordinals."""
+    result = dict(_NO_REST)
 
-    # Find the most recent game before game_date
-    past = [d for d in dates if d < game_date]
-    if not past:
+    # Dates are sorted, so the most recent game before game_date sits just
+    # left of its insertion point
+    day = game_date.toordinal()
+    idx = int(np.searchsorted(dates, day))
+    if idx == 0:
         return result
 
-    last_game = past[-1]
-    rest_days = (game_date - last_game).days
+    rest_days = day - int(dates[idx - 1])
     result["rest_days"] = rest_days
     result["back_to_back"] = rest_days == 1
 
     # 3-in-4: including today's game, 3 games within any 4-night window
-    window_start = game_date - timedelta(days=3)
-    games_in_window = sum(1 for d in dates if window_start <= d < game_date)
+    games_in_window = idx - int(np.searchsorted(dates, day - 3))
     # games_in_window counts past games in the window; +1 for today's game
     result["three_in_four"] = (games_in_window + 1) >= 3
 
     return result
 
 
-# ── Predict a Single Game ────────────────────────────────────────────────
+# ── Star Ratings ─────────────────────────────────────────────────────────
 
-def predict_game(
-    home_abbrev: str,
-    away_abbrev: str,
+# STAR_THRESHOLDS in ascending threshold order, for searchsorted
+_STAR_T = np.array([t for t, _ in sorted(STAR_THRESHOLDS)], dtype=np.float64)
+_STAR_S = np.array([s for _, s in sorted(STAR_THRESHOLDS)])
+
+
+def _stars_for(abs_diff):
+    """Map |adjusted diff| to a star rating; accepts a scalar or an array.
+
+    Picks the highest threshold <= *abs_diff*; anything below the lowest
+    threshold gets the lowest tier.
+    """
+    idx = np.searchsorted(_STAR_T, abs_diff, side="right") - 1
+    return _STAR_S[np.maximum(idx, 0)]
+
+
+# ── Predict a Slate ──────────────────────────────────────────────────────
+
+def _column(rows: list[dict], key: str) -> np.ndarray:
+    return np.array([r[key] for r in rows], dtype=np.float64)
+
+
+def predict_slate(
+    matchups: list[tuple[str, str]],
     ratings: dict[str, dict],
-    schedule_cache: dict[str, list[date]],
-    game_date: date,
-    game_odds: dict | None = None,
-) -> dict | None:
-    """Predict one game. Returns a prediction dict or None if data missing."""
-    home_r = ratings.get(home_abbrev)
-    away_r = ratings.get(away_abbrev)
-    if not home_r or not away_r:
-        log.warning("Missing ratings for %s or %s", home_abbrev, away_abbrev)
-        return None
+    rest_by_team: dict[str, dict],
+    odds_map: dict[str, dict] | None = None,
+) -> list[dict]:
+    """Predict every (home, away) matchup in one vectorized pass.
+
+    *rest_by_team* maps abbrev → _rest_from_dates result for the game date;
+    *odds_map* is keyed by "AWAY @ HOME". Matchups with missing ratings are
+    logged and dropped; the rest are returned in input order.
+    """
+    valid: list[tuple[str, str]] = []
+    for home, away in matchups:
+        if home in ratings and away in ratings:
+            valid.append((home, away))
+        else:
+            log.warning("Missing ratings for %s or %s", home, away)
+    if not valid:
+        return []
+
+    home_r = [ratings[h] for h, _ in valid]
+    away_r = [ratings[a] for _, a in valid]
+    home_rest = [rest_by_team.get(h, _NO_REST) for h, _ in valid]
+    away_rest = [rest_by_team.get(a, _NO_REST) for _, a in valid]
+
+    h_b2b = _column(home_rest, "back_to_back")
+    a_b2b = _column(away_rest, "back_to_back")
+    h_3in4 = _column(home_rest, "three_in_four")
+    a_3in4 = _column(away_rest, "three_in_four")
+    h_rested = _column(home_rest, "rest_days") >= 3
+    a_rested = _column(away_rest, "rest_days") >= 3
 
     # Base composite diff (home perspective): use venue-specific split
-    home_venue = (
-        home_r["composite"]
-        + WEIGHTS["home_road_split"] * home_r["home_pct"]
-    )
-    away_venue = (
-        away_r["composite"]
-        + WEIGHTS["home_road_split"] * away_r["road_pct"]
-    )
+    w_split = WEIGHTS["home_road_split"]
+    home_venue = _column(home_r, "composite") + w_split * _column(home_r, "home_pct")
+    away_venue = _column(away_r, "composite") + w_split * _column(away_r, "road_pct")
     diff = home_venue - away_venue
 
-    # Situational adjustments
-    adjustments: list[str] = []
-
+    # Situational adjustments — each penalty flips to a benefit for home
+    # when it's the away team that's affected
     diff += HOME_ICE_BONUS
-    adjustments.append("home ice")
-
-    home_rest = detect_rest_situation(home_abbrev, game_date, schedule_cache)
-    away_rest = detect_rest_situation(away_abbrev, game_date, schedule_cache)
-
-    if home_rest["back_to_back"]:
-        diff += BACK_TO_BACK_PENALTY
-        adjustments.append(f"{home_abbrev} B2B")
-    if away_rest["back_to_back"]:
-        diff -= BACK_TO_BACK_PENALTY  # penalty flips to benefit home
-        adjustments.append(f"{away_abbrev} B2B")
-
-    if home_rest["three_in_four"]:
-        diff += THREE_IN_FOUR_PENALTY
-        adjustments.append(f"{home_abbrev} 3-in-4")
-    if away_rest["three_in_four"]:
-        diff -= THREE_IN_FOUR_PENALTY
-        adjustments.append(f"{away_abbrev} 3-in-4")
-
-    if home_rest["rest_days"] >= 3:
-        diff += EXTENDED_REST_BONUS
-        adjustments.append(f"{home_abbrev} rested")
-    if away_rest["rest_days"] >= 3:
-        diff -= EXTENDED_REST_BONUS
-        adjustments.append(f"{away_abbrev} rested")
-
-    # Determine pick
-    abs_diff = abs(diff)
-    if abs_diff < SKIP_THRESHOLD:
-        pick = "SKIP"
-        stars = 0
-    else:
-        pick = home_abbrev if diff > 0 else away_abbrev
-        stars = 1
-        for threshold, s in STAR_THRESHOLDS:
-            if abs_diff >= threshold:
-                stars = s
-                break
-
-    # Early-season cap
-    min_gp = min(home_r["gp"], away_r["gp"])
-    if min_gp < EARLY_SEASON_GP and stars > 2:
-        stars = 2
-        adjustments.append("early-season cap")
-
-    # Build reasoning string
-    key_factors = ", ".join(adjustments[:4]) if adjustments else "even matchup"
-
-    # EV calculation (only when odds are available and we have a real pick)
-    ev_pct = None
-    pick_odds = None
-    if game_odds and pick != "SKIP":
-        pick_odds = game_odds["home_odds"] if pick == home_abbrev else game_odds["away_odds"]
-        model_prob = _diff_to_win_prob(abs(diff))
-        ev_pct = _ev_pct(model_prob, pick_odds)
+    diff += BACK_TO_BACK_PENALTY * (h_b2b - a_b2b)
+    diff += THREE_IN_FOUR_PENALTY * (h_3in4 - a_3in4)
+    diff += EXTENDED_REST_BONUS * (h_rested.astype(np.float64) - a_rested)
+
+    # Determine pick and stars, with the early-season cap
+    abs_diff = np.abs(diff)
+    skip = abs_diff < SKIP_THRESHOLD
+    stars = np.where(skip, 0, _stars_for(abs_diff))
+    min_gp = np.minimum(_column(home_r, "gp"), _column(away_r, "gp"))
+    capped = (min_gp < EARLY_SEASON_GP) & (stars > 2)
+    stars = np.where(capped, 2, stars)
 
-    return {
-        "game": f"{away_abbrev} @ {home_abbrev}",
-        "home": home_abbrev,
-        "away": away_abbrev,
-        "pick": pick,
-        "stars": stars,
-        "diff": round(diff, 4),
-        "key_factors": key_factors,
-        "ev_pct": ev_pct,
-        "pick_odds": pick_odds,
-    }
+    predictions: list[dict] = []
+    for i, (home, away) in enumerate(valid):
+        adjustments = ["home ice"]
+        if h_b2b[i]:
+            adjustments.append(f"{home} B2B")
+        if a_b2b[i]:
+            adjustments.append(f"{away} B2B")
+        if h_3in4[i]:
+            adjustments.append(f"{home} 3-in-4")
+        if a_3in4[i]:
+            adjustments.append(f"{away} 3-in-4")
+        if h_rested[i]:
+            adjustments.append(f"{home} rested")
+        if a_rested[i]:
+            adjustments.append(f"{away} rested")
+        if capped[i]:
+            adjustments.append("early-season cap")
+
+        # Build reasoning string
+        key_factors = ", ".join(adjustments[:4]) if adjustments else "even matchup"
+
+        game_key = f"{away} @ {home}"
+        game_diff = float(diff[i])
+        pick = "SKIP" if skip[i] else (home if game_diff > 0 else away)
+
+        # EV calculation (only when odds are available and we have a real pick)
+        ev_pct = None
+        pick_odds = None
+        game_odds = odds_map.get(game_key) if odds_map else None
+        if game_odds and pick != "SKIP":
+            pick_odds = game_odds["home_odds"] if pick == home else game_odds["away_odds"]
+            model_prob = _diff_to_win_prob(abs(game_diff))
+            ev_pct = _ev_pct(model_prob, pick_odds)
+
+        predictions.append({
+            "game": game_key,
+            "home": home,
+            "away": away,
+            "pick": pick,
+            "stars": int(stars[i]),
+            "diff": round(game_diff, 4),
+            "key_factors": key_factors,
+            "ev_pct": ev_pct,
+            "pick_odds": pick_odds,
+        })
+
+    return predictions
+
+
+def predict_game(
+    home_abbrev: str,
+    away_abbrev: str,
+    ratings: dict[str, dict],
+    rest_by_team: dict[str, dict],
+    game_odds: dict | None = None,
+) -> dict | None:
+    """Predict one game. Returns a prediction dict or None if data missing."""
+    odds_map = {f"{away_abbrev} @ {home_abbrev}": game_odds} if game_odds else None
+    preds = predict_slate([(home_abbrev, away_abbrev)], ratings, rest_by_team, odds_map)
+    return preds[0] if preds else None
 
 
 # ── Predict All Today's Games ────────────────────────────────────────────
@@ -349,19 +362,40 @@ def predict_today(
         log.error("Could not compute team ratings — aborting predictions")
         return []
 
-    schedule_cache: dict[str, list[date]] = {}
-    predictions: list[dict] = []
+    # Prefetch every rated team's schedule concurrently, with a sync
+    # fallback for any team the prefetch missed
+    abbrevs = {
+        game.get(side, {}).get("abbrev", "")
+        for game in games
+        for side in ("homeTeam", "awayTeam")
+    }
+    abbrevs &= ratings.keys()
+    schedules = asyncio.run(fetch_team_schedules_bulk(abbrevs))
+    schedule_cache: dict[str, np.ndarray] = {
+        abbrev: game_dates_from_schedule(sched) for abbrev, sched in schedules.items()
+    }
+    for abbrev in abbrevs - schedule_cache.keys():
+        schedule_cache[abbrev] = game_dates_from_schedule(fetch_team_schedule(abbrev))
+
+    missing = sorted(abbrev for abbrev, dates in schedule_cache.items() if dates.size == 0)
+    if missing:
+        log.warning("No schedule data for %s — skipping rest adjustments", ", ".join(missing))
+
+    # Rest profile depends only on team and date — compute once per team.
+    # Teams with no schedule are left out and get no rest adjustments.
+    rest_by_team = {
+        abbrev: _rest_from_dates(dates, game_date)
+        for abbrev, dates in schedule_cache.items()
+        if dates.size
+    }
 
+    matchups: list[tuple[str, str]] = []
     for game in games:
         home = game.get("homeTeam", {}).get("abbrev", "")
         away = game.get("awayTeam", {}).get("abbrev", "")
-        if not home or not away:
-            continue
-        game_key = f"{away} @ {home}"
-        game_odds = odds_map.get(game_key) if odds_map else None
-        pred = predict_game(home, away, ratings, schedule_cache, game_date, game_odds)
-        if pred:
-            predictions.append(pred)
+        if home and away:
+            matchups.append((home, away))
 
+    predictions = predict_slate(matchups, ratings, rest_by_team, odds_map)
     predictions.sort(key=lambda p: -p["stars"])
     return predictions
@@ -0,0 +1,54 @@
+"""Numeric kernels for the rating model — JIT-compiled with numba when installed.
+
+numba is optional: without it the same kernels run as plain NumPy, which is
+plenty for a single slate. With it, historical backtests that rebuild
+ratings thousands of times run at near-C speed.
+"""
+
+import numpy as np
+
+try:
+    import numba
+except ImportError:  # fall back to NumPy
+    numba = None
+
+
+def _normalize_and_score_numpy(X: np.ndarray, w: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Min-max normalize each column of *X* into [0, 1] and score rows by *w*.
+
+    Constant columns normalize to 0.5. Returns (Xn, Xn @ w).
+    """
+    lo, hi = X.min(axis=0), X.max(axis=0)
+    flat = hi == lo
+    span = np.where(flat, 1.0, hi - lo)
+    Xn = np.where(flat, 0.5, (X - lo) / span)
+    return Xn, Xn @ w
+
+
+def _normalize_and_score_loops(X, w):
+    """Loop form of _normalize_and_score_numpy, written for numba.njit.
+
+    Explicit loops avoid NumPy's per-call overhead on small T×F matrices and,
+    unlike ``@``, don't need SciPy's BLAS bindings under numba.
+    """
+    n_rows, n_cols = X.shape
+    lo = np.empty(n_cols)
+    hi = np.empty(n_cols)
+    for j in range(n_cols):
+        lo[j] = X[:, j].min()
+        hi[j] = X[:, j].max()
+
+    Xn = np.empty_like(X)
+    score = np.zeros(n_rows)
+    for i in range(n_rows):
+        for j in range(n_cols):
+            span = hi[j] - lo[j]
+            Xn[i, j] = 0.5 if span == 0 else (X[i, j] - lo[j]) / span
+            score[i] += Xn[i, j] * w[j]
+    return Xn, score
+
+
+if numba is not None:
+    normalize_and_score = numba.njit(cache=True, fastmath=True)(_normalize_and_score_loops)
+else:
+    normalize_and_score = _normalize_and_score_numpy
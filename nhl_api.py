@@ -1,12 +1,25 @@
 """NHL public API client — standings, team stats, schedule, scores."""
 
+import asyncio
+import functools
+import hashlib
+import json
 import logging
 import unicodedata
-from datetime import date, datetime
+from collections.abc import Iterable
+from datetime import date, datetime, timedelta, timezone
+from pathlib import Path
 
-import requests
+import httpx
+import numpy as np
+
+try:
+    import orjson
+except ImportError:  # stdlib json fallback
+    orjson = None
 
 from config import (
+    CACHE_DIR,
     STANDINGS_URL,
     SCHEDULE_URL,
     SCORE_URL,
@@ -16,19 +29,118 @@ from config import (
 
 log = logging.getLogger(__name__)
 
-_SESSION = requests.Session()
-_SESSION.headers.update({"User-Agent": "SportsAlgo/1.0"})
-
 TIMEOUT = 15
 
+# Shared by the sync client and the async prefetch client. httpx already
+# negotiates gzip/deflate; HTTP/2 multiplexes concurrent requests to a host.
+# The .../now endpoints 307 to a dated URL, and unlike requests httpx won't
+# follow redirects unless asked.
+_CLIENT_OPTIONS = {
+    "http2": True,
+    "follow_redirects": True,
+    "timeout": httpx.Timeout(TIMEOUT),
+    "headers": {"User-Agent": "SportsAlgo/1.0"},
+    "limits": httpx.Limits(max_keepalive_connections=16, max_connections=32),
+}
+
+_SESSION = httpx.Client(**_CLIENT_OPTIONS)
+
+_SCHEDULE_TTL = timedelta(days=1)  # schedule dates rarely change intra-day
+_cache_enabled = True
+
+
+def _parse_json(content: bytes):
+    """Decode a JSON document, using orjson when it's installed."""
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
+# ── On-disk Response Cache ──────────────────────────────────────────────
+
+def set_cache_enabled(enabled: bool) -> None:
+    """Turn the on-disk caches on or off (see main.py --no-cache)."""
+    global _cache_enabled
+    _cache_enabled = enabled
+
+
+def cache_enabled() -> bool:
+    """Whether on-disk caches may be read or written (False under --no-cache)."""
+    return _cache_enabled
+
+
+def _cache_path(url: str) -> Path:
+    digest = hashlib.blake2b(url.encode(), digest_size=16).hexdigest()
+    return CACHE_DIR / f"{digest}.json"
 
+
+def _cache_load(url: str, ttl: timedelta) -> dict | None:
+    """Return the cached payload for *url* if younger than *ttl*, else None."""
+    if not _cache_enabled:
+        return None
+    try:
+        entry = _parse_json(_cache_path(url).read_bytes())
+        fetched_at = datetime.fromisoformat(entry["fetched_at"])
+    except (OSError, ValueError, KeyError):
+        return None
+    if datetime.now(timezone.utc) - fetched_at >= ttl:
+        return None
+    return entry["payload"]
+
+
+def _cache_store(url: str, payload: dict) -> None:
+    if not _cache_enabled:
+        return
+    entry = {"fetched_at": datetime.now(timezone.utc).isoformat(), "payload": payload}
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        _cache_path(url).write_text(json.dumps(entry))
+    except OSError as exc:
+        log.debug("Could not write cache entry for %s — %s", url, exc)
+
+
+def disk_cached(ttl: timedelta):
+    """Serve a fetch-by-URL function from the on-disk cache while fresh.
+
+    The wrapped function accepts optional ``ttl=`` and ``cache_if=`` overrides
+    per call; payloads failing ``cache_if`` are neither served nor stored.
+    Failed fetches (None) are never cached.
+    """
+    def decorator(fn):
+        @functools.wraps(fn)
+        def wrapper(url: str, ttl: timedelta = ttl, cache_if=None) -> dict | None:
+            payload = _cache_load(url, ttl)
+            if payload is not None and (cache_if is None or cache_if(payload)):
+                return payload
+            payload = fn(url)
+            if payload is not None and (cache_if is None or cache_if(payload)):
+                _cache_store(url, payload)
+            return payload
+        return wrapper
+    return decorator
+
+
+# ── HTTP ─────────────────────────────────────────────────────────────────
+
+@disk_cached(ttl=timedelta(hours=6))
 def _get(url: str) -> dict | None:
     """GET JSON from *url*, returning None on failure."""
     try:
-        resp = _SESSION.get(url, timeout=TIMEOUT)
+        resp = _SESSION.get(url)
         resp.raise_for_status()
-        return resp.json()
-    except requests.RequestException as exc:
+        return _parse_json(resp.content)
+    except (httpx.HTTPError, ValueError) as exc:
+        log.warning("API request failed: %s — %s", url, exc)
+        return None
+
+
+async def _aget(session: httpx.AsyncClient, url: str) -> dict | None:
+    """Async counterpart of _get for use with an httpx.AsyncClient."""
+    try:
+        resp = await session.get(url)
+        resp.raise_for_status()
+        return _parse_json(resp.content)
+    except (httpx.HTTPError, ValueError) as exc:
         log.warning("API request failed: %s — %s", url, exc)
         return None
 
@@ -82,19 +194,23 @@ def build_full_name_to_abbrev(standings: list[dict]) -> dict[str, str]:
     return mapping
 
 
-def fetch_team_stats(standings: list[dict] | None = None) -> dict[str, dict]:
+def fetch_team_stats(
+    standings: list[dict] | None = None,
+    name_map: dict[str, str] | None = None,
+) -> dict[str, dict]:
     """Return {teamAbbrev: stats_dict} from the stats summary API.
 
     Keys include: powerPlayPct, penaltyKillPct, shotsForPerGame, shotsAgainstPerGame.
+    Pass a prebuilt *name_map* (e.g. from build_full_name_to_abbrev) to skip
+    rebuilding it from *standings* on every call.
     """
     data = _get(TEAM_STATS_URL)
     if not data:
         return {}
 
     # Build name→abbrev map from standings (stats API only has teamFullName)
-    name_map: dict[str, str] = {}
-    if standings:
-        name_map = _build_name_to_abbrev(standings)
+    if name_map is None:
+        name_map = _build_name_to_abbrev(standings) if standings else {}
 
     out: dict[str, dict] = {}
     for row in data.get("data", []):
@@ -109,6 +225,8 @@ def fetch_team_stats(standings: list[dict] | None = None) -> dict[str, dict]:
 
 # ── Today's Schedule ────────────────────────────────────────────────────
 
+_GAME_TYPES = frozenset({2, 3})  # regular season, playoffs
+
 def fetch_todays_games(game_date: date | None = None) -> list[dict]:
     """Return today's games from /v1/schedule/now.
 
@@ -120,19 +238,26 @@ def fetch_todays_games(game_date: date | None = None) -> list[dict]:
     if not data:
         return []
     today_str = (game_date or date.today()).isoformat()
-    for week in data.get("gameWeek", []):
-        if week.get("date") == today_str:
-            # Only return regular-season (gameType 2) or playoff (gameType 3) games
-            return [g for g in week.get("games", []) if g.get("gameType") in (2, 3)]
-    return []
+    games_by_date = {w.get("date"): w.get("games", []) for w in data.get("gameWeek", [])}
+    return [g for g in games_by_date.get(today_str, []) if g.get("gameType") in _GAME_TYPES]
 
 
 # ── Scores for a Given Date ─────────────────────────────────────────────
 
+_FINAL_STATES = frozenset({"FINAL", "OFF"})
+
+
+def _all_final(data: dict) -> bool:
+    """True once every game in a score payload is over."""
+    return all(g.get("gameState") in _FINAL_STATES for g in data.get("games", []))
+
+
 def fetch_scores(game_date: date) -> list[dict]:
     """Return finished-game results for *game_date* (YYYY-MM-DD)."""
     url = f"{SCORE_URL}/{game_date.isoformat()}"
-    data = _get(url)
+    # Only cache a slate once it's complete — a run just after midnight can
+    # see late games still in progress
+    data = _get(url, cache_if=_all_final)
     if not data:
         return []
     return data.get("games", [])
@@ -140,27 +265,79 @@ def fetch_scores(game_date: date) -> list[dict]:
 
 # ── Team Season Schedule (for rest-day detection) ───────────────────────
 
-def fetch_team_schedule(team_abbrev: str) -> list[dict]:
+# Schedules fetched this process, keyed by team abbrev. Only successful
+# fetches are stored, so a failed request is retried on the next call.
+_SCHEDULES: dict[str, tuple[dict, ...]] = {}
+
+
+def fetch_team_schedule(team_abbrev: str) -> tuple[dict, ...]:
     """Return the full season schedule for *team_abbrev*.
 
-    Used to detect back-to-backs and 3-in-4 situations.
+    Used to detect back-to-backs and 3-in-4 situations. Memoized for the
+    lifetime of the process (on top of the on-disk cache), so the result
+    is a tuple and must not be mutated. Returns () if the request failed.
     """
+    if team_abbrev in _SCHEDULES:
+        return _SCHEDULES[team_abbrev]
     url = f"{TEAM_SCHEDULE_URL}/{team_abbrev}/now"
-    data = _get(url)
+    data = _get(url, ttl=_SCHEDULE_TTL)
     if not data:
-        return []
-    return data.get("games", [])
+        return ()
+    _SCHEDULES[team_abbrev] = tuple(data.get("games", []))
+    return _SCHEDULES[team_abbrev]
+
+
+async def fetch_team_schedules_bulk(abbrevs: Iterable[str]) -> dict[str, tuple[dict, ...]]:
+    """Fetch season schedules for all *abbrevs* concurrently.
+
+    Returns {abbrev: games}. Shares fetch_team_schedule's in-process memo,
+    so repeat calls (e.g. backfills) only hit the network for new teams.
+    Teams whose request failed are left out so the caller can fall back to
+    fetch_team_schedule.
+    """
+    out: dict[str, tuple[dict, ...]] = {}
+    urls: dict[str, str] = {}
+    for abbrev in abbrevs:
+        if abbrev in _SCHEDULES:
+            out[abbrev] = _SCHEDULES[abbrev]
+            continue
+        url = f"{TEAM_SCHEDULE_URL}/{abbrev}/now"
+        cached = _cache_load(url, _SCHEDULE_TTL)
+        if cached is not None:
+            out[abbrev] = _SCHEDULES[abbrev] = tuple(cached.get("games", []))
+        else:
+            urls[abbrev] = url
+    if not urls:
+        return out
+
+    async with httpx.AsyncClient(**_CLIENT_OPTIONS) as session:
+        tasks = [_aget(session, url) for url in urls.values()]
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+
+    for (abbrev, url), data in zip(urls.items(), results):
+        if isinstance(data, BaseException):
+            log.warning("Schedule prefetch failed for %s — %s", abbrev, data)
+            continue
+        if data:
+            _cache_store(url, data)
+            out[abbrev] = _SCHEDULES[abbrev] = tuple(data.get("games", []))
+    return out
+
 
+def game_dates_from_schedule(schedule: Iterable[dict]) -> np.ndarray:
+    """Extract sorted game dates from a team schedule as int64 day ordinals.
 
-def game_dates_from_schedule(schedule: list[dict]) -> list[date]:
-    """Extract sorted game dates from a team schedule."""
-    dates: list[date] = []
+    Ordinals (date.toordinal()) keep the per-team cache compact and let rest
+    detection use np.searchsorted directly.
+    """
+    ordinals: list[int] = []
     for g in schedule:
         raw = g.get("gameDate")
         if raw:
             try:
-                dates.append(datetime.strptime(raw, "%Y-%m-%d").date())
+                ordinals.append(date.fromisoformat(raw).toordinal())
             except ValueError:
                 pass
+    dates = np.array(ordinals, dtype=np.int64)
     dates.sort()
     return dates
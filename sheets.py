@@ -1,31 +1,123 @@
 """Google Sheets integration via gspread — write picks & track accuracy."""
 
 import base64
+import functools
+import hashlib
+import itertools
 import json
 import logging
 import os
+import random
+import threading
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 
 import gspread
 
-from config import SHEET_NAME, TAB_DAILY, TAB_TRACKER
+from config import CACHE_DIR, SHEET_NAME, TAB_DAILY, TAB_TRACKER
+from nhl_api import cache_enabled
 
 log = logging.getLogger(__name__)
 
 
+# ── Retry / Backoff ──────────────────────────────────────────────────────
+
+_RETRY_STATUSES = frozenset({429, 500, 503})
+# A 429 is rejected before it's applied, so any request can be retried on it;
+# a 5xx may have been applied, so only idempotent methods retry on those
+_QUOTA_STATUSES = frozenset({429})
+_IDEMPOTENT_METHODS = frozenset({"get", "put"})
+
+
+def retry_on_quota(
+    fn=None,
+    *,
+    statuses: frozenset[int] = _RETRY_STATUSES,
+    max_retries: int = 6,
+    base: float = 1.0,
+    cap: float = 60.0,
+):
+    """Retry *fn* on Sheets APIErrors whose status is in *statuses*.
+
+    By default that's quota (429) and transient 5xx errors. Waits for the
+    server's Retry-After when given, otherwise uses full-jitter exponential
+    backoff: uniform(0, min(cap, base * 2**attempt)) seconds.
+    Usable bare (@retry_on_quota) or with arguments.
+    """
+    if fn is None:
+        return functools.partial(
+            retry_on_quota, statuses=statuses, max_retries=max_retries, base=base, cap=cap,
+        )
+
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        for attempt in range(max_retries + 1):
+            try:
+                return fn(*args, **kwargs)
+            except gspread.exceptions.APIError as exc:
+                status = exc.response.status_code
+                if status not in statuses or attempt == max_retries:
+                    raise
+                try:
+                    delay = min(cap, float(exc.response.headers["Retry-After"]))
+                except (KeyError, ValueError):
+                    delay = random.uniform(0, min(cap, base * 2 ** attempt))
+                log.warning(
+                    "Sheets API %d — retrying in %.1fs (%d/%d)",
+                    status, delay, attempt + 1, max_retries,
+                )
+                time.sleep(delay)
+
+    return wrapper
+
+
+class _RetryingHTTPClient(gspread.HTTPClient):
+    """gspread HTTP client that sends every request through retry_on_quota.
+
+    Retrying at the transport layer covers every call (open, reads, writes)
+    exactly once, instead of nesting retries around whole writer functions.
+    POSTs (values.append, batchUpdate) retry on 429 only — repeating one the
+    server already applied would duplicate rows or formatting rules.
+    """
+
+    def request(self, method: str, endpoint: str, *args, **kwargs):
+        if method.lower() in _IDEMPOTENT_METHODS:
+            return self._request_idempotent(method, endpoint, *args, **kwargs)
+        return self._request_once(method, endpoint, *args, **kwargs)
+
+    @retry_on_quota
+    def _request_idempotent(self, *args, **kwargs):
+        return super().request(*args, **kwargs)
+
+    @retry_on_quota(statuses=_QUOTA_STATUSES)
+    def _request_once(self, *args, **kwargs):
+        return super().request(*args, **kwargs)
+
+
 # ── Auth ─────────────────────────────────────────────────────────────────
 
 def get_client() -> gspread.Client | None:
-    """Return an authenticated gspread client, or None if creds unavailable."""
+    """Return an authenticated gspread client, or None if creds unavailable.
+
+    The client is built once per process, so every caller shares its
+    service-account token and pooled keep-alive session.
+    """
+    return _build_client()
+
+
+@functools.lru_cache(maxsize=1)
+def _build_client() -> gspread.Client | None:
     # Option 1: base64-encoded JSON in env var (GitHub Actions)
     b64 = os.environ.get("GOOGLE_CREDENTIALS_B64")
     if b64:
         creds_json = json.loads(base64.b64decode(b64))
-        return gspread.service_account_from_dict(creds_json)
+        return gspread.service_account_from_dict(creds_json, http_client=_RetryingHTTPClient)
 
     # Option 2: local file
     creds_file = os.environ.get("GOOGLE_CREDENTIALS_FILE", "credentials.json")
     if os.path.exists(creds_file):
-        return gspread.service_account(filename=creds_file)
+        return gspread.service_account(filename=creds_file, http_client=_RetryingHTTPClient)
 
     log.warning("No Google credentials found — sheets operations will be skipped")
     return None
@@ -33,35 +125,117 @@ def get_client() -> gspread.Client | None:
 
 # ── Helpers ──────────────────────────────────────────────────────────────
 
+# Spreadsheet handles keyed by (client, title) — client.open() is a Drive
+# lookup-by-name round trip, so do it at most once per run
+_SHEET_CACHE: dict[tuple[int, str], gspread.Spreadsheet] = {}
+
+
+def _open_sheet(client: gspread.Client, name: str = SHEET_NAME) -> gspread.Spreadsheet:
+    """Open spreadsheet *name*, reusing the handle from earlier calls."""
+    key = (id(client), name)
+    if key not in _SHEET_CACHE:
+        _SHEET_CACHE[key] = client.open(name)
+    return _SHEET_CACHE[key]
+
+
+# Worksheets per spreadsheet keyed by spreadsheet id — one metadata fetch
+# serves every tab lookup, instead of a worksheet() call per tab
+_WS_CACHE: dict[str, dict[str, gspread.Worksheet]] = {}
+_WS_LOCK = threading.Lock()  # publish_picks looks up tabs from two threads
+
+# Developer-metadata key marking a tab whose tracker header is in place
+_HEADER_KEY = "headerInitialized"
+# (spreadsheet id, sheet id) of tabs carrying the _HEADER_KEY marker
+_HEADER_MARKED: set[tuple[str, int]] = set()
+
+
+def _worksheets(spreadsheet) -> dict[str, gspread.Worksheet]:
+    """Return {title: worksheet} for *spreadsheet*; hold _WS_LOCK.
+
+    Built from a single fetch_sheet_metadata() — the same request
+    worksheets() makes — which also carries each tab's developer metadata.
+    """
+    key = spreadsheet.id
+    if key not in _WS_CACHE:
+        tabs = {}
+        for sheet in spreadsheet.fetch_sheet_metadata().get("sheets", []):
+            ws = gspread.Worksheet(spreadsheet, sheet["properties"], spreadsheet.id, spreadsheet.client)
+            tabs[ws.title] = ws
+            if any(m.get("metadataKey") == _HEADER_KEY for m in sheet.get("developerMetadata", ())):
+                _HEADER_MARKED.add((spreadsheet.id, ws.id))
+        _WS_CACHE[key] = tabs
+    return _WS_CACHE[key]
+
+
+def _mark_header(ws) -> None:
+    """Tag *ws* with the _HEADER_KEY marker so later runs skip the header probe.
+
+    The marker lives on the tab itself, so deleting the tab drops it too.
+    """
+    ws.spreadsheet.batch_update({"requests": [{
+        "createDeveloperMetadata": {
+            "developerMetadata": {
+                "metadataKey": _HEADER_KEY,
+                "metadataValue": ws.title,
+                "location": {"sheetId": ws.id},
+                "visibility": "PROJECT",
+            }
+        }
+    }]})
+    _HEADER_MARKED.add((ws.spreadsheet.id, ws.id))
+
+
 def _get_or_create_worksheet(spreadsheet, title: str, rows: int = 1000, cols: int = 10):
     """Get worksheet by title, creating it if missing."""
-    try:
-        return spreadsheet.worksheet(title)
-    except gspread.WorksheetNotFound:
-        return spreadsheet.add_worksheet(title=title, rows=rows, cols=cols)
+    with _WS_LOCK:
+        tabs = _worksheets(spreadsheet)
+        if title not in tabs:
+            tabs[title] = spreadsheet.add_worksheet(title=title, rows=rows, cols=cols)
+        return tabs[title]
 
 
 def _cleanup_default_sheet(spreadsheet) -> None:
     """Delete the default 'Sheet1' tab if other tabs exist."""
-    try:
-        sheet1 = spreadsheet.worksheet("Sheet1")
-        if len(spreadsheet.worksheets()) > 1:
-            spreadsheet.del_worksheet(sheet1)
+    with _WS_LOCK:
+        tabs = _worksheets(spreadsheet)
+        if "Sheet1" in tabs and len(tabs) > 1:
+            spreadsheet.del_worksheet(tabs.pop("Sheet1"))
             log.info("Deleted default 'Sheet1' tab")
-    except gspread.WorksheetNotFound:
-        pass
+
+
+# ── Tracker Reads ────────────────────────────────────────────────────────
+
+def _read_tracker(ws) -> list[list]:
+    """Return every tracker row (header and summary included)."""
+    # Raw values over the tracker's eight columns: numbers (Stars, Odds, P/L)
+    # arrive as JSON numbers, while dates stay "YYYY-MM-DD" strings
+    return ws.get(
+        "A1:H",
+        value_render_option=gspread.utils.ValueRenderOption.unformatted,
+        date_time_render_option=gspread.utils.DateTimeOption.formatted_string,
+    )
 
 
 # ── Daily Picks (overwrite) ─────────────────────────────────────────────
 
-def _read_tracker_rows_for_date(sh, date_str: str) -> list[list[str]]:
+_STAR_CACHE = tuple("*" * i for i in range(6))  # star display for 0–5 stars
+
+# Fingerprint of the last grid written to the Daily Picks tab
+_DAILY_FP = CACHE_DIR / "daily.fp"
+
+
+def _fingerprint(ws, rows: list[list]) -> str:
+    payload = json.dumps([ws.spreadsheet.id, ws.id, rows], default=str).encode()
+    return hashlib.blake2b(payload, digest_size=16).hexdigest()
+
+
+def _read_tracker_rows_for_date(sh, date_str: str) -> list[list]:
     """Return tracker rows matching date_str (skips header + summary row)."""
-    try:
-        ws = sh.worksheet(TAB_TRACKER)
-        all_rows = ws.get_all_values()
-        return [row for row in all_rows[2:] if row and row[0] == date_str]
-    except gspread.WorksheetNotFound:
+    with _WS_LOCK:
+        ws = _worksheets(sh).get(TAB_TRACKER)
+    if ws is None:
         return []
+    return [row for row in _read_tracker(ws)[2:] if row and row[0] == date_str]
 
 
 def write_daily_picks(
@@ -71,18 +245,24 @@ def write_daily_picks(
     yesterday_str: str | None = None,
 ) -> None:
     """Overwrite the 'Daily Picks' tab with today's picks and yesterday's results."""
-    sh = client.open(SHEET_NAME)
+    sh = _open_sheet(client)
+    with _WS_LOCK:
+        existed = TAB_DAILY in _worksheets(sh)
     ws = _get_or_create_worksheet(sh, TAB_DAILY)
     _cleanup_default_sheet(sh)
 
-    rows = []
-
     # ── Today's picks ──
-    rows.append([f"Today — {today_str}", "", "", "", ""])
-    rows.append(["Game", "Pick", "Stars", "Key Factors", ""])
-    for p in predictions:
-        star_display = "SKIP" if p["pick"] == "SKIP" else "*" * p["stars"]
-        rows.append([p["game"], p["pick"], star_display, p["key_factors"], ""])
+    rows = [
+        [f"Today — {today_str}", "", "", "", ""],
+        ["Game", "Pick", "Stars", "Key Factors", ""],
+    ]
+    rows += [
+        [p["game"], p["pick"], "SKIP" if p["pick"] == "SKIP" else _STAR_CACHE[p["stars"]], p["key_factors"], ""]
+        for p in predictions
+    ]
+    if not predictions:
+        # Still rewrite the tab so it doesn't keep showing an earlier date
+        rows.append(["No predictions generated — see the run log", "", "", "", ""])
 
     # ── EV Plays ──
     ev_plays = sorted(
@@ -114,9 +294,27 @@ def write_daily_picks(
                     r[5] if len(r) > 5 else "",
                 ])
 
+    # Skip the clear + rewrite when the tab already holds exactly these rows
+    # (a freshly created tab is empty, whatever the fingerprint says);
+    # --no-cache always rewrites
+    fp = _fingerprint(ws, rows)
+    try:
+        if existed and cache_enabled() and _DAILY_FP.read_text() == fp:
+            log.info("Daily picks unchanged — skipping '%s' write", TAB_DAILY)
+            return
+    except OSError:
+        pass
+
     ws.clear()
     ws.update(rows, "A1")
     log.info("Wrote %d picks to '%s'", len(predictions), TAB_DAILY)
+    if not cache_enabled():
+        return
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        _DAILY_FP.write_text(fp)
+    except OSError as exc:
+        log.debug("Could not write daily picks fingerprint — %s", exc)
 
 
 # ── Standings (no-game days) ─────────────────────────────────────────────
@@ -127,7 +325,7 @@ def write_standings(
     today_str: str,
 ) -> None:
     """Overwrite the 'Daily Picks' tab with current standings when no games."""
-    sh = client.open(SHEET_NAME)
+    sh = _open_sheet(client)
     ws = _get_or_create_worksheet(sh, TAB_DAILY)
     _cleanup_default_sheet(sh)
 
@@ -180,6 +378,10 @@ def write_standings(
     ws.clear()
     ws.update(rows, "A1")
     log.info("Wrote standings to '%s'", TAB_DAILY)
+    try:
+        _DAILY_FP.unlink(missing_ok=True)  # the picks grid is gone from the tab
+    except OSError as exc:
+        log.debug("Could not remove daily picks fingerprint — %s", exc)
 
 
 # ── Season Tracker (append) ─────────────────────────────────────────────
@@ -221,68 +423,139 @@ def _apply_tracker_formatting(ws) -> None:
     log.info("Applied green conditional formatting for 5-star rows")
 
 
+_TRACKER_CHUNK = 500  # rows per write request — bounds the payload size
+
+
+def _row_iter(predictions: list[dict], today_str: str):
+    """Yield a tracker row for each non-SKIP pick (results TBD)."""
+    for p in predictions:
+        if p["pick"] == "SKIP":
+            continue
+        yield [
+            today_str,
+            p["game"],
+            p["pick"],
+            p["stars"],
+            "",                     # Result — filled in next day
+            "",                     # Correct? — filled in next day
+            p.get("pick_odds", ""),  # Odds
+            "",                     # P/L — filled in next day
+        ]
+
+
 def append_to_tracker(
     client: gspread.Client,
     predictions: list[dict],
     today_str: str,
 ) -> None:
     """Append today's picks to the 'Season Tracker' tab (results TBD)."""
-    sh = client.open(SHEET_NAME)
+    # SKIP-only slates append nothing — don't spend open/probe calls on them
+    if not any(p["pick"] != "SKIP" for p in predictions):
+        log.info("No non-SKIP picks — skipping tracker append")
+        return
+
+    sh = _open_sheet(client)
     ws = _get_or_create_worksheet(sh, TAB_TRACKER)
 
     _HEADER = ["Date", "Game", "Pick", "Stars", "Result", "Correct?", "Odds", "P/L"]
 
-    # Ensure header exists
-    existing = ws.get_all_values()
-    if not existing or not existing[0] or existing[0][0] != "Date":
-        ws.update([_HEADER], "A1")
-        # Row 2 is the summary — non-empty placeholder prevents append_rows overwriting it
-        ws.update([["Season Record: —", "", "", "", "", "", "", ""]], "A2")
-        _apply_tracker_formatting(ws)
-    elif len(existing[0]) < 8:
-        # Upgrade existing header to include Odds and P/L columns
-        ws.update([_HEADER], "A1")
-        log.info("Upgraded tracker header to include Odds and P/L columns")
+    # Header and summary placeholder go out in one values.batchUpdate
+    batch: list[dict] = []
+    new_tracker = False
+
+    marked = (sh.id, ws.id) in _HEADER_MARKED
+    if marked:
+        # Header is known to be in place — only the Date column is needed
+        date_col = ws.get("A:A")
+    else:
+        # Probe only the header row and the Date column (for dedup) — one
+        # bounded request instead of downloading the whole tracker
+        header, date_col = ws.batch_get(["A1:H1", "A:A"])
+
+        # Ensure header exists
+        if not header or not header[0] or header[0][0] != "Date":
+            batch.append({"range": "A1", "values": [_HEADER]})
+            # Row 2 is the summary — non-empty placeholder keeps data rows below it
+            batch.append({"range": "A2", "values": [["Season Record: —", "", "", "", "", "", "", ""]]})
+            new_tracker = True
+        elif len(header[0]) < 8:
+            # Upgrade existing header to include Odds and P/L columns
+            batch.append({"range": "A1", "values": [_HEADER]})
+            log.info("Upgraded tracker header to include Odds and P/L columns")
+
+    if batch:
+        # Header (and summary placeholder) first, so the append lands below them
+        ws.batch_update(batch, value_input_option="USER_ENTERED")
 
     # Dedup — skip if today's picks are already in the tracker
-    if any(row[0] == today_str for row in existing[2:]):
+    appended = 0
+    if any(row and row[0] == today_str for row in date_col[2:]):
         log.info("Picks for %s already in tracker — skipping", today_str)
-        return
+    else:
+        # Rows are generated lazily and appended _TRACKER_CHUNK at a time;
+        # values.append finds the first free row server-side
+        rows = _row_iter(predictions, today_str)
+        while chunk := list(itertools.islice(rows, _TRACKER_CHUNK)):
+            sh.values_append(
+                gspread.utils.absolute_range_name(TAB_TRACKER, "A:H"),
+                params={"valueInputOption": "USER_ENTERED", "insertDataOption": "INSERT_ROWS"},
+                body={"values": chunk},
+            )
+            appended += len(chunk)
+
+    if new_tracker:
+        _apply_tracker_formatting(ws)
+    if not marked:
+        _mark_header(ws)
+    if appended:
+        log.info("Appended %d rows to '%s'", appended, TAB_TRACKER)
 
-    new_rows = []
-    for p in predictions:
-        if p["pick"] == "SKIP":
-            continue
-        odds_val = p.get("pick_odds", "")
-        new_rows.append([
-            today_str,
-            p["game"],
-            p["pick"],
-            p["stars"],
-            "",        # Result — filled in next day
-            "",        # Correct? — filled in next day
-            odds_val,  # Odds
-            "",        # P/L — filled in next day
-        ])
 
-    if new_rows:
-        ws.append_rows(new_rows, value_input_option="USER_ENTERED")
-        log.info("Appended %d rows to '%s'", len(new_rows), TAB_TRACKER)
+# ── Concurrent Writers ───────────────────────────────────────────────────
+
+def publish_picks(
+    client: gspread.Client,
+    predictions: list[dict],
+    today_str: str,
+    yesterday_str: str | None = None,
+) -> None:
+    """Write the 'Daily Picks' tab and append to the tracker concurrently.
+
+    The two writers touch different tabs and are network-bound, so running
+    them on worker threads overlaps their round trips. Call update_results
+    first — the Daily Picks tab reads yesterday's results from the tracker.
+    """
+    # SKIP-only (or empty) slates have nothing to append — only the Daily
+    # Picks tab needs writing, so skip the threads and the pre-open
+    if not any(p["pick"] != "SKIP" for p in predictions):
+        write_daily_picks(client, predictions, today_str, yesterday_str)
+        return
+
+    # Open the spreadsheet (and list its tabs) up front, so both threads find
+    # it cached instead of racing to open their own handles
+    sh = _open_sheet(client)
+    with _WS_LOCK:
+        _worksheets(sh)
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        daily = pool.submit(write_daily_picks, client, predictions, today_str, yesterday_str)
+        tracker = pool.submit(append_to_tracker, client, predictions, today_str)
+        daily.result()
+        tracker.result()
 
 
 # ── Update Yesterday's Results ───────────────────────────────────────────
 
-def update_results(
-    client: gspread.Client,
-    yesterday_str: str,
-    scores: list[dict],
-) -> None:
-    """Fill in Result and Correct? columns for yesterday's picks."""
-    sh = client.open(SHEET_NAME)
-    ws = _get_or_create_worksheet(sh, TAB_TRACKER)
-    all_rows = ws.get_all_values()
+def _index_by_date(all_rows: list[list[str]]) -> dict[str, list[int]]:
+    """Map each pick date to its tracker row indices (skips header + summary)."""
+    date_index: dict[str, list[int]] = {}
+    for i, row in enumerate(all_rows[2:], start=2):
+        if row and row[0]:
+            date_index.setdefault(row[0], []).append(i)
+    return date_index
 
-    # Build a lookup: "AWAY @ HOME" → "WINNER score-score"
+
+def _results_map(scores: list[dict]) -> dict[str, tuple[str, str]]:
+    """Build a lookup: "AWAY @ HOME" → ("WINNER score-score", WINNER)."""
     results_map: dict[str, tuple[str, str]] = {}
     for game in scores:
         home = game.get("homeTeam", {})
@@ -295,67 +568,118 @@ def update_results(
         winner = home_abbrev if home_score > away_score else away_abbrev
         result_str = f"{winner} {max(home_score, away_score)}-{min(home_score, away_score)}"
         results_map[game_key] = (result_str, winner)
+    return results_map
 
-    updates = 0
-    for i, row in enumerate(all_rows):
-        if len(row) < 4:
-            continue
-        row_date, game_str, pick = row[0], row[1], row[2]
-        if row_date != yesterday_str:
-            continue
-        if game_str in results_map:
-            result_str, winner = results_map[game_str]
-            correct = "Y" if pick == winner else "N"
-            cell_row = i + 1  # 1-indexed
-            ws.update(f"E{cell_row}", [[result_str]])
-            ws.update(f"F{cell_row}", [[correct]])
-
-            # P/L on $100 stake using stored odds (column G, index 6)
-            if len(row) > 6 and row[6] not in ("", None):
-                try:
-                    odds = int(row[6])
-                    if correct == "Y":
-                        pl = float(odds) if odds >= 0 else round(10000.0 / abs(odds), 2)
-                    else:
-                        pl = -100.0
-                    ws.update(f"H{cell_row}", [[pl]])
-                except (ValueError, ZeroDivisionError):
-                    pass
 
-            updates += 1
+def update_results(
+    client: gspread.Client,
+    yesterday_str: str,
+    scores: list[dict],
+) -> None:
+    """Fill in Result and Correct? columns for yesterday's picks."""
+    update_results_multi(client, {yesterday_str: scores})
 
-    log.info("Updated %d results for %s", updates, yesterday_str)
 
-    if updates:
-        update_summary_row(ws, all_rows)
+def update_results_multi(
+    client: gspread.Client,
+    scores_by_date: dict[str, list[dict]],
+) -> None:
+    """Fill in Result, Correct? and P/L for several pick dates at once.
+
+    One tracker read and one batch write cover every date, so an M-day
+    backfill costs the same two requests as a single day.
+    """
+    sh = _open_sheet(client)
+    ws = _get_or_create_worksheet(sh, TAB_TRACKER)
+    all_rows = _read_tracker(ws)
+
+    # Collect every cell write and send them in one batch request
+    date_index = _index_by_date(all_rows)
+    updates_batch: list[dict] = []
+    for date_str, scores in scores_by_date.items():
+        results_map = _results_map(scores)
+        updates = 0
+        for i in date_index.get(date_str, ()):
+            row = all_rows[i]
+            if len(row) < 4:
+                continue
+            game_str, pick = row[1], row[2]
+            if game_str in results_map:
+                result_str, winner = results_map[game_str]
+                correct = "Y" if pick == winner else "N"
+                cell_row = i + 1  # 1-indexed
+                updates_batch.append({"range": f"E{cell_row}:F{cell_row}", "values": [[result_str, correct]]})
+
+                # Mirror the writes locally so the summary sees the new results
+                row_mut = list(row) + [""] * (8 - len(row))
+                row_mut[4] = result_str
+                row_mut[5] = correct
+                all_rows[i] = row_mut
+
+                # P/L on $100 stake using stored odds (column G, index 6)
+                if len(row) > 6 and row[6] not in ("", None):
+                    try:
+                        odds = int(row[6])
+                        if correct == "Y":
+                            pl = float(odds) if odds >= 0 else round(10000.0 / abs(odds), 2)
+                        else:
+                            pl = -100.0
+                        updates_batch.append({"range": f"H{cell_row}", "values": [[pl]]})
+                        row_mut[7] = pl
+                    except (ValueError, ZeroDivisionError):
+                        pass
+
+                updates += 1
+
+        log.info("Updated %d results for %s", updates, date_str)
+
+    if updates_batch:
+        # all_rows already reflects this batch, so the summary rides along in
+        # the same request — one values.batchUpdate commits results + summary
+        updates_batch.append(_summary_entry(all_rows))
+        ws.batch_update(updates_batch, value_input_option="USER_ENTERED")
 
 
 # ── Summary Row ──────────────────────────────────────────────────────────
 
 def update_summary_row(ws, all_rows: list[list[str]] | None = None) -> None:
-    """Recalculate the W-L summary in row 2 of the tracker."""
+    """Recalculate the W-L summary in row 2 of the tracker.
+
+    Pass *all_rows* to avoid a full-sheet re-fetch; update_results instead
+    folds the summary into its own batch via _summary_entry.
+    """
     if all_rows is None:
-        all_rows = ws.get_all_values()
+        all_rows = _read_tracker(ws)
+    ws.batch_update([_summary_entry(all_rows)], value_input_option="USER_ENTERED")
+
+
+def _pct(wins: int, total: int, digits: int = 0) -> str:
+    """Win rate as "NN%" (with *digits* decimals), or "N/A" for no games."""
+    return f"{wins / total * 100:.{digits}f}%" if total else "N/A"
 
+
+_STARS_MAP = {str(i): i for i in range(10)}  # star cell → int, without isdigit/int per row
+_YN = frozenset(("Y", "N"))
+
+
+def _summary_entry(all_rows: list[list[str]]) -> dict:
+    """Build the row-2 summary as a batch_update {range, values} entry."""
     total_w = total_l = 0
     total_pl = 0.0
-    star_stats: dict[int, dict[str, int]] = {}
+    star_stats: defaultdict[int, list[int]] = defaultdict(lambda: [0, 0])  # stars → [W, L]
 
     for row in all_rows[2:]:  # skip header + summary
-        if len(row) < 6 or row[5] not in ("Y", "N"):
+        if len(row) < 6:
             continue
-        stars = int(row[3]) if row[3].isdigit() else 0
-        correct = row[5] == "Y"
-        if correct:
-            total_w += 1
-        else:
-            total_l += 1
-        if stars not in star_stats:
-            star_stats[stars] = {"W": 0, "L": 0}
-        if correct:
-            star_stats[stars]["W"] += 1
-        else:
-            star_stats[stars]["L"] += 1
+        correct = row[5]
+        if correct not in _YN:
+            continue
+        stars = row[3]
+        stars = int(stars) if isinstance(stars, (int, float)) else _STARS_MAP.get(stars, 0)
+        idx = 0 if correct == "Y" else 1
+        star_stats[stars][idx] += 1
+        total_w += 1 - idx
+        total_l += idx
         # Accumulate P/L (column H, index 7)
         if len(row) > 7 and row[7] not in ("", None):
             try:
@@ -363,18 +687,17 @@ def update_summary_row(ws, all_rows: list[list[str]] | None = None) -> None:
             except ValueError:
                 pass
 
-    total = total_w + total_l
-    pct = f"{total_w / total * 100:.1f}%" if total else "N/A"
     roi_str = f"${total_pl:+.2f}" if total_pl != 0 else "—"
 
-    parts = [f"Overall: {total_w}-{total_l} ({pct})", f"ROI: {roi_str} per $100/bet"]
-    for s in sorted(star_stats):
-        sw = star_stats[s]["W"]
-        sl = star_stats[s]["L"]
-        st = sw + sl
-        sp = f"{sw / st * 100:.0f}%" if st else "N/A"
-        parts.append(f"{s}*: {sw}-{sl} ({sp})")
+    parts = [
+        f"Overall: {total_w}-{total_l} ({_pct(total_w, total_w + total_l, 1)})",
+        f"ROI: {roi_str} per $100/bet",
+    ]
+    parts.extend(
+        f"{s}*: {sw}-{sl} ({_pct(sw, sw + sl)})"
+        for s, (sw, sl) in sorted(star_stats.items())
+    )
 
     summary = " | ".join(parts)
-    ws.update("A2", [[summary, "", "", "", "", "", "", ""]])
     log.info("Summary: %s", summary)
+    return {"range": "A2", "values": [[summary, "", "", "", "", "", "", ""]]}